@@ -5,6 +5,8 @@ from rich import print
 import logging
 import msgpack
 
+from traffic_taffy.dissection import Dissection
+
 
 def parse_args():
     "Parse the command line arguments."
@@ -39,7 +41,9 @@ def main():
 
     for cache_file in args.cache_file:
         print(f"===== {cache_file} ======")
-        contents = msgpack.load(open(cache_file, "rb"), strict_map_key=False)
+        contents = msgpack.load(
+            Dissection.open_saved_file(cache_file), strict_map_key=False
+        )
 
         # play the major keys
         for key in contents.keys():
@@ -5,6 +5,15 @@ from logging import info, debug
 from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
 from typing import List
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
 from traffic_taffy.comparison import Comparison
 from traffic_taffy.dissectmany import PCAPDissectMany
 from traffic_taffy.output.console import Console
@@ -15,6 +24,66 @@ from traffic_taffy.dissector import (
     limitor_add_parseargs,
     check_dissector_level,
 )
+from traffic_taffy.dissector_engine import PCAP_READ_BUFFER
+
+
+# the elementwise delta computation is a tight numeric kernel, so
+# compile it with numba when available; the numpy fallback below is
+# still vectorized, just with extra temporaries
+if HAVE_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def _delta_kernel(
+        left_count,
+        right_count,
+        in_both,
+        in_right,
+        inverted_left_total,
+        inverted_right_total,
+        delta_percentage,
+        total,
+    ):
+        "Fills the delta_percentage and total columns from the count columns"
+        # single-sided subkeys always report a full +-100% delta, and
+        # (historically) a negated total when only on the left
+        for row in prange(left_count.size):
+            if in_both[row]:
+                delta_percentage[row] = (
+                    right_count[row] * inverted_right_total
+                    - left_count[row] * inverted_left_total
+                )
+                total[row] = right_count[row] + left_count[row]
+            elif in_right[row]:
+                delta_percentage[row] = 1.0
+                total[row] = right_count[row]
+            else:
+                delta_percentage[row] = -1.0
+                total[row] = -left_count[row]
+
+else:
+
+    def _delta_kernel(
+        left_count,
+        right_count,
+        in_both,
+        in_right,
+        inverted_left_total,
+        inverted_right_total,
+        delta_percentage,
+        total,
+    ):
+        "Fills the delta_percentage and total columns from the count columns"
+        delta_percentage[:] = np.where(
+            in_both,
+            right_count * inverted_right_total
+            - left_count * inverted_left_total,
+            np.where(in_right, 1.0, -1.0),
+        )
+        total[:] = np.where(
+            in_both,
+            right_count + left_count,
+            np.where(in_right, right_count, -left_count),
+        )
 
 
 class PcapCompare:
@@ -33,6 +102,9 @@ class PcapCompare:
         bin_size: int | None = None,
         dissection_level: PCAPDissectorLevel = PCAPDissectorLevel.COUNT_ONLY,
         between_times: List[int] | None = None,
+        maximum_cores: int | None = None,
+        use_scapy: bool = False,
+        pcap_read_buffer: int = PCAP_READ_BUFFER,
     ) -> None:
         self.pcap_files = pcap_files
         self.deep = deep
@@ -43,6 +115,9 @@ class PcapCompare:
         self.between_times = between_times
         self.bin_size = bin_size
         self.cache_file_suffix = cache_file_suffix
+        self.maximum_cores = maximum_cores
+        self.use_scapy = use_scapy
+        self.pcap_read_buffer = pcap_read_buffer
 
     @property
     def pcap_files(self):
@@ -61,58 +136,75 @@ class PcapCompare:
         self._reports = newvalue
 
     def compare_dissections(self, left_side: dict, right_side: dict) -> dict:
-        "compares the results from two reports"
+        """Compares the results from two reports.
+
+        The returned Comparison contents map each key to a set of
+        parallel numpy columns (one row per subkey) rather than a dict
+        per subkey; a handful of arrays is far cheaper than millions of
+        tiny dicts and lets consumers filter and sort vectorized."""
 
         report = {}
 
-        # TODO: missing key in right_side (major items added)
         keys = set(left_side.keys())
         keys = keys.union(right_side.keys())
         for key in keys:
-            left_side_total = left_side[key].total()
-            right_side_total = right_side[key].total()
-            report[key] = {}
-
-            for subkey in left_side[key].keys():
-                delta_percentage = 0.0
-                total = 0
-                if subkey in left_side[key] and subkey in right_side[key]:
-                    delta_percentage = (
-                        right_side[key][subkey] / right_side_total
-                        - left_side[key][subkey] / left_side_total
-                    )
-                    total = right_side[key][subkey] + left_side[key][subkey]
-                    left_count = left_side[key][subkey]
-                    right_count = right_side[key][subkey]
-                else:
-                    delta_percentage = -1.0
-                    total = -left_side[key][subkey]
-                    left_count = left_side[key][subkey]
-                    right_count = 0
-
-                delta_absolute = right_count - left_count
-                report[key][subkey] = {
-                    "delta_percentage": delta_percentage,
-                    "delta_absolute": delta_absolute,
-                    "total": total,
-                    "left_count": left_count,
-                    "right_count": right_count,
-                }
-
-            for subkey in right_side[key].keys():
-                if subkey not in report[key]:
-                    delta_percentage = 1.0
-                    total = right_side[key][subkey]
-                    left_count = 0
-                    right_count = right_side[key][subkey]
-
-                    report[key][subkey] = {
-                        "delta_percentage": delta_percentage,
-                        "delta_absolute": right_count,
-                        "total": total,
-                        "left_count": left_count,
-                        "right_count": right_count,
-                    }
+            left_values = left_side[key]
+            right_values = right_side[key]
+
+            # multiplying by the inverted totals is cheaper than
+            # dividing for every subkey
+            left_total = left_values.total()
+            right_total = right_values.total()
+            inverted_left_total = 1.0 / left_total if left_total else 0.0
+            inverted_right_total = 1.0 / right_total if right_total else 0.0
+
+            subkeys = np.fromiter(
+                left_values.keys() | right_values.keys(), dtype=object
+            )
+            count = len(subkeys)
+            left_count = np.fromiter(
+                (left_values.get(subkey, 0) for subkey in subkeys),
+                dtype=np.int64,
+                count=count,
+            )
+            right_count = np.fromiter(
+                (right_values.get(subkey, 0) for subkey in subkeys),
+                dtype=np.int64,
+                count=count,
+            )
+            in_both = np.fromiter(
+                (subkey in left_values and subkey in right_values
+                 for subkey in subkeys),
+                dtype=bool,
+                count=count,
+            )
+            in_right = np.fromiter(
+                (subkey in right_values for subkey in subkeys),
+                dtype=bool,
+                count=count,
+            )
+
+            delta_percentage = np.empty(count, dtype=np.float64)
+            total = np.empty(count, dtype=np.int64)
+            _delta_kernel(
+                left_count,
+                right_count,
+                in_both,
+                in_right,
+                inverted_left_total,
+                inverted_right_total,
+                delta_percentage,
+                total,
+            )
+
+            report[key] = {
+                "subkeys": subkeys,
+                "left_count": left_count,
+                "right_count": right_count,
+                "delta_percentage": delta_percentage,
+                "delta_absolute": right_count - left_count,
+                "total": total,
+            }
 
         return Comparison(report)
 
@@ -127,6 +219,9 @@ class PcapCompare:
             cache_results=self.cache_results,
             cache_file_suffix=self.cache_file_suffix,
             dissector_level=self.dissection_level,
+            maximum_cores=self.maximum_cores,
+            use_scapy=self.use_scapy,
+            pcap_read_buffer=self.pcap_read_buffer,
         )
         results = pdm.load_all()
         return results
@@ -321,6 +416,9 @@ def main():
             dissection_level=args.dissection_level,
             between_times=args.between_times,
             bin_size=args.bin_size,
+            maximum_cores=args.jobs,
+            use_scapy=args.use_scapy,
+            pcap_read_buffer=args.pcap_read_buffer,
         )
 
         # compare the pcaps
@@ -5,8 +5,14 @@ from logging import debug, info, error
 from enum import Enum
 import msgpack
 import ipaddress
+import numpy as np
 from typing import List
 
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
 
 class PCAPDissectorLevel(Enum):
     COUNT_ONLY = 1
@@ -38,6 +44,7 @@ class Dissection:
         self.bin_size = bin_size
         self.cache_file_suffix = cache_file_suffix
         self._data = defaultdict(Dissection.subdict_producer)
+        self._int_bins = {}
         self._timestamp = 0
         self.dissector_level = dissector_level
         self.maximum_count = maximum_count
@@ -78,19 +85,47 @@ class Dissection:
     def pcap_file(self, newval):
         self._pcap_file = newval
 
+    INT_BIN_SIZE: int = 65536
+
     def incr(self, key: str, value: Any, count: int = 1):
         "increase one field within the counter"
         # always save a total count at the zero bin
         # note: there should be no recorded tcpdump files from 1970 Jan 01 :-)
-        self.data[0][key][value] += count
+
+        # small integers (ports, protocol numbers, flags, ...) are by
+        # far the most common values, so the global bin counts them in a
+        # flat array indexed by value instead of a Counter -- one array
+        # store beats a hash plus Counter.__missing__ per field.  the
+        # arrays are folded back into Counters by _materialize_int_bins.
+        if type(value) is int and 0 <= value < Dissection.INT_BIN_SIZE:
+            int_bins = self._int_bins.get(key)
+            if int_bins is None:
+                int_bins = self._int_bins[key] = np.zeros(
+                    Dissection.INT_BIN_SIZE, np.uint32
+                )
+            int_bins[value] += count
+        else:
+            self.data[0][key][value] += count
+
         if self.timestamp:
             if self.timestamp not in self.data:
                 self.data[self.timestamp] = defaultdict(Counter)
             self.data[self.timestamp][key][value] += count
 
+    def _materialize_int_bins(self) -> None:
+        "Folds the array-backed integer bins back into the Counter storage"
+        if not self._int_bins:
+            return
+        for key, int_bins in self._int_bins.items():
+            counter = self.data[0][key]
+            for value in np.nonzero(int_bins)[0]:
+                counter[int(value)] += int(int_bins[value])
+        self._int_bins.clear()
+
     def calculate_metadata(self) -> None:
         "Calculates things like the number of value entries within each key/subkey"
         # TODO: do we do this with or without key and value matches?
+        self._materialize_int_bins()
         for timestamp in self.data.keys():
             for key in self.data[timestamp]:
                 if self.WIDTH_SUBKEY in self.data[timestamp][key]:
@@ -102,11 +137,19 @@ class Dissection:
 
     def merge(self, other_dissection) -> None:
         "merges counters in two dissections into self -- note destructive to self"
-        for key in other_dissection.data:
-            for subkey in other_dissection.data[key]:
-                if key not in self.data:
-                    self.data[key] = defaultdict(Counter)
-                self.data[key][subkey] += other_dissection.data[key][subkey]
+        self._materialize_int_bins()
+        other_dissection._materialize_int_bins()
+        data = self.data
+        for timestamp, counter_sets in other_dissection.data.items():
+            bucket = data[timestamp]
+            for key, counters in counter_sets.items():
+                existing = bucket.get(key)
+                if existing is None:
+                    bucket[key] = counters.copy()
+                else:
+                    # one Counter-level update instead of a python-level
+                    # lookup-and-increment per subkey
+                    existing += counters
 
     @staticmethod
     def subdict_producer():
@@ -191,6 +234,8 @@ class Dissection:
     def save(self, where: str) -> None:
         "Saves a generated dissection to a msgpack file"
 
+        self._materialize_int_bins()
+
         # wrap the report in a version header
         versioned_cache = {
             self.DISSECTION_KEY: self.DISSECTION_VERSION,
@@ -216,9 +261,15 @@ class Dissection:
             versioned_cache["parameters"]["ignore_list"]
         )
 
-        # save it
+        # save it, compressed when the zstandard module is around
         info(f"caching PCAP data to '{where}'")
-        msgpack.dump(versioned_cache, open(where, "wb"))
+        if zstd:
+            compressor = zstd.ZstdCompressor(level=3, threads=-1)
+            with open(where, "wb") as handle:
+                with compressor.stream_writer(handle) as writer:
+                    msgpack.dump(versioned_cache, writer)
+        else:
+            msgpack.dump(versioned_cache, open(where, "wb"))
 
     def load_saved_contents(self, versioned_cache):
         # set the local parameters from the cache
@@ -228,9 +279,24 @@ class Dissection:
         # load the data
         self.data = versioned_cache["dissection"]
 
+    ZSTD_MAGIC: bytes = b"\x28\xb5\x2f\xfd"
+
+    @staticmethod
+    def open_saved_file(where: str):
+        "Opens a saved dissection, decompressing it if it was saved compressed"
+        handle = open(where, "rb")
+        if handle.peek(4)[0:4] != Dissection.ZSTD_MAGIC:
+            return handle
+        if not zstd:
+            raise ValueError(
+                f"cannot read the compressed cache in {where}:"
+                + " the zstandard module is not installed"
+            )
+        return zstd.ZstdDecompressor().stream_reader(handle)
+
     def load_saved(self, where: str, dont_overwrite: bool = False) -> dict:
         "Loads a previous saved report from a file instead of re-parsing pcaps"
-        contents = msgpack.load(open(where, "rb"), strict_map_key=False)
+        contents = msgpack.load(Dissection.open_saved_file(where), strict_map_key=False)
 
         # convert the ignore list to a set (msgpack doesn't do sets)
         contents["parameters"]["ignore_list"] = set(
@@ -259,6 +325,7 @@ class Dissection:
         minimum_count: int | None = None,
         make_printable: bool = False,
     ):
+        self._materialize_int_bins()
         data = self.data
 
         if not timestamps:
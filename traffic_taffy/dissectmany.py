@@ -13,12 +13,16 @@ class PCAPDissectMany:
         self.kwargs = kwargs
         self.futures = {}
 
-        self.maximum_cores = self.kwargs.get("maximum_cores")
-        if not self.maximum_cores:
-            # since we're loading multiple files in parallel, reduce the
-            # maximum number of cores available to the splitter
-            # TODO: this may undercount due to int flooring()
-            self.maximum_cores = int(multiprocessing.cpu_count() / len(self.pcap_files))
+        # note: pop() so the remaining kwargs can be passed to PCAPDissector
+        requested_cores = self.kwargs.pop("maximum_cores", None)
+        if not requested_cores:
+            requested_cores = multiprocessing.cpu_count()
+        # we load files in parallel and each file runs its own splitter
+        # pool, so divide the core budget between the two levels to keep
+        # the total process count within what was requested
+        # TODO: this may undercount due to int flooring()
+        self.file_workers = min(len(self.pcap_files), requested_cores)
+        self.maximum_cores = max(1, int(requested_cores / self.file_workers))
 
     def load_pcap_piece(self, pcap_io_buffer):
         kwargs = copy.copy(self.kwargs)
@@ -30,7 +34,12 @@ class PCAPDissectMany:
             **self.kwargs,
         )
         pd.load()
-        return pd.dissection
+        dissection = pd.dissection
+        if not isinstance(dissection.pcap_file, str):
+            # drop the splitter's io buffer: it may be closed by now
+            # (scapy closes it) and either way it won't pickle usefully
+            dissection.pcap_file = ""
+        return dissection
 
     def load_pcap(self, pcap_file, split_size=None, maximum_count=0):
         pd = PCAPDissector(
@@ -60,11 +69,12 @@ class PCAPDissectMany:
             dissection.merge(result.result())
 
         dissection.calculate_metadata()
+        # the merged pieces only knew their io buffers; record the real name
+        dissection.pcap_file = pcap_file
 
         if self.kwargs.get("cache_results"):
             # create a dissector just to save the cache
             # (we don't call load())
-            dissection.pcap_file = pcap_file
             dissection.save_to_cache(
                 pcap_file + "." + self.kwargs.get("cache_file_suffix", "taffy")
             )
@@ -72,6 +82,7 @@ class PCAPDissectMany:
         return dissection
 
     def load_all(self):
-        with ProcessPoolExecutor() as executor:
+        # load all the files at once, each with its own process
+        with ProcessPoolExecutor(max_workers=self.file_workers) as executor:
             dissections = executor.map(self.load_pcap, self.pcap_files)
             return dissections
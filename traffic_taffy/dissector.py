@@ -1,9 +1,11 @@
 import sys
+from copy import copy
 from logging import warning, error
 from collections import Counter, defaultdict
 from typing import List
 from rich import print
-from dissection import PCAPDissectorLevel, Dissection
+from traffic_taffy.dissection import PCAPDissectorLevel, Dissection
+from traffic_taffy.dissector_engine import PCAP_READ_BUFFER
 
 
 class PCAPDissector:
@@ -19,6 +21,8 @@ class PCAPDissector:
         cache_results: bool = False,
         cache_file_suffix: str = "taffy",
         ignore_list: list = [],
+        use_scapy: bool = False,
+        pcap_read_buffer: int = PCAP_READ_BUFFER,
     ):
         self.pcap_file = pcap_file
         self.dissector_level = dissector_level
@@ -30,6 +34,8 @@ class PCAPDissector:
             cache_file_suffix = "." + cache_file_suffix
         self.cache_file_suffix = cache_file_suffix
         self.ignore_list = ignore_list
+        self.use_scapy = use_scapy
+        self.pcap_read_buffer = pcap_read_buffer
 
         if dissector_level == PCAPDissectorLevel.COUNT_ONLY and bin_size == 0:
             warning("counting packets only with no binning is unlikely to be helpful")
@@ -51,6 +57,7 @@ class PCAPDissector:
             self.dissector_level,
             self.cache_file_suffix,
             set(self.ignore_list),
+            self.pcap_read_buffer,
         )
 
     def load_from_cache(self):
@@ -67,12 +74,12 @@ class PCAPDissector:
         if cached_data:
             return cached_data
 
+        # dpkt's streaming parser is much faster than scapy's per-field
+        # python dissection, so it's the default at every level; scapy
+        # remains available for DETAILED when its extra fields are needed
         engine = None
         args = self.dissection_args()
-        if (
-            self.dissector_level == PCAPDissectorLevel.DETAILED
-            or self.dissector_level == PCAPDissectorLevel.DETAILED.value
-        ):
+        if self.use_scapy:
             from traffic_taffy.dissector_engine.scapy import DissectionEngineScapy
 
             engine = DissectionEngineScapy(*args)
@@ -169,6 +176,27 @@ def dissector_add_parseargs(parser, add_subgroup: bool = True):
         help="A comma separated list of (unlikely to be useful) data fields to ignore",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        default=None,
+        type=int,
+        help="Maximum number of worker processes to use when loading pcaps",
+    )
+
+    parser.add_argument(
+        "--pcap-read-buffer",
+        default=PCAP_READ_BUFFER,
+        type=int,
+        help="Size of the pcap read buffer in bytes",
+    )
+
+    parser.add_argument(
+        "--use-scapy",
+        action="store_true",
+        help="Use scapy for dissection (slower, but more detailed fields)",
+    )
+
     parser.add_argument(
         "-n",
         "--packet-count",
@@ -247,11 +275,18 @@ def check_dissector_level(level: int):
 
 def pcap_data_merge(d1: dict, d2: dict):
     "merges counters in deep d2 dict into d1 -- note destructive to d1"
-    for key in d2:
-        for subkey in d2[key]:
-            if key not in d1:
-                d1[key] = defaultdict(Counter)
-            d1[key][subkey] += d2[key][subkey]
+    for key, counters in d2.items():
+        bucket = d1.setdefault(key, defaultdict(Counter))
+        for subkey, count in counters.items():
+            existing = bucket.get(subkey)
+            if existing is None:
+                bucket[subkey] = copy(count)
+            elif isinstance(existing, Counter):
+                # one Counter-level update instead of a python-level
+                # lookup-and-increment per value
+                existing += count
+            else:
+                bucket[subkey] = existing + count
     return d1
 
 
@@ -303,6 +338,8 @@ def main():
         cache_results=args.cache_pcap_results,
         cache_file_suffix=args.cache_file_suffix,
         ignore_list=args.ignore_list.split(","),
+        use_scapy=args.use_scapy,
+        pcap_read_buffer=args.pcap_read_buffer,
     )
     pd.load()
 
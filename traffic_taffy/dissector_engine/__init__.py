@@ -1,6 +1,15 @@
 """Base class for a dissection engine with subclasses overriding load()"""
 
+import io
+import mmap
+import os
+
 from traffic_taffy.dissection import Dissection, PCAPDissectorLevel
+from pcap_parallel import PCAPParallel as pcapp
+
+# the default 4 KiB stdio buffer creates millions of tiny read()
+# syscalls on multi-GB pcaps; 128 KiB measurably cuts wall-clock time
+PCAP_READ_BUFFER: int = 128 * 1024
 
 
 class DissectionEngine:
@@ -13,6 +22,7 @@ class DissectionEngine:
         dissector_level: PCAPDissectorLevel = PCAPDissectorLevel.DETAILED,
         cache_file_suffix: str = "pkl",
         ignore_list: list = [],
+        pcap_read_buffer: int = PCAP_READ_BUFFER,
     ):
         self.pcap_file = pcap_file
         self.dissector_level = dissector_level
@@ -21,6 +31,38 @@ class DissectionEngine:
         self.pcap_filter = pcap_filter
         self.cache_file_suffix = cache_file_suffix
         self.ignore_list = set(ignore_list)
+        self.pcap_read_buffer = pcap_read_buffer
+
+    def open_pcap_file(self):
+        "Opens self.pcap_file (decompressing if needed) with a large read buffer"
+        handle = pcapp.open_maybe_compressed(self.pcap_file)
+        if not isinstance(handle, io.BufferedReader):
+            return handle  # a decompressing stream -- use it as is
+
+        # a plain uncompressed file: a read-only mmap serves the
+        # dissector straight from the page cache with no copies
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            except (AttributeError, OSError):
+                pass  # not available on all platforms
+            handle.close()
+            return mapped
+        except (ValueError, OSError):
+            pass  # empty file or a platform without usable mmap
+
+        # fall back to rewrapping the raw stream with our own (much
+        # larger than default) buffer size
+        handle = io.BufferedReader(handle.detach(), buffer_size=self.pcap_read_buffer)
+
+        # tell the kernel we'll read the whole file front to back so
+        # it can read ahead aggressively instead of waiting on us
+        try:
+            os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except (AttributeError, OSError):
+            pass  # not available on all platforms (eg macOS)
+        return handle
 
     def init_dissection(self) -> Dissection:
         self.dissection = Dissection(
@@ -1,6 +1,5 @@
 from traffic_taffy.dissector_engine import DissectionEngine
 from traffic_taffy.dissection import Dissection, PCAPDissectorLevel
-from pcap_parallel import PCAPParallel as pcapp
 
 import dpkt
 
@@ -12,17 +11,42 @@ class DissectionEngineDpkt(DissectionEngine):
     def load(self) -> Dissection:
         self.init_dissection()
         if isinstance(self.pcap_file, str):
-            pcap = dpkt.pcap.Reader(pcapp.open_maybe_compressed(self.pcap_file))
+            pcap = dpkt.pcap.Reader(self.open_pcap_file())
         else:
             # it's an open handle already
             pcap = dpkt.pcap.Reader(self.pcap_file)
         if self.pcap_filter:
             pcap.setfilter(self.pcap_filter)
-        pcap.dispatch(self.maximum_count, self.callback)
+
+        level = self.dissector_level
+        if isinstance(level, PCAPDissectorLevel):
+            level = level.value
+        if level < PCAPDissectorLevel.THROUGH_IP.value and not self.pcap_filter:
+            self.count_only(pcap)
+        else:
+            pcap.dispatch(self.maximum_count, self.callback)
 
         self.dissection.calculate_metadata()
         return self.dissection
 
+    def count_only(self, pcap) -> None:
+        "Tight counting loop that never constructs per-packet objects"
+        dissection = self.dissection
+        bin_size = self.bin_size
+        maximum_count = self.maximum_count
+
+        count = 0
+        for timestamp, _ in pcap:
+            timestamp = int(timestamp)
+            if bin_size:
+                timestamp = timestamp - timestamp % bin_size
+            dissection.timestamp = timestamp
+            dissection.incr(Dissection.TOTAL_COUNT, Dissection.TOTAL_SUBKEY)
+
+            count += 1
+            if maximum_count and count >= maximum_count:
+                break
+
     def incr(self, dissection, name, value):
         if name not in self.ignore_list:
             dissection.incr(name, value)
@@ -81,7 +105,8 @@ class DissectionEngineDpkt(DissectionEngine):
                     self.incr(dissection, prefix + "UDP.len", udp.ulen)
                     self.incr(dissection, prefix + "UDP.chksum", udp.sum)
 
-                    # TODO: handle DNS and others for level 3
+                    if level >= PCAPDissectorLevel.DETAILED.value:
+                        self.dissect_dns(udp, prefix + "UDP.")
 
                 elif isinstance(ip.data, dpkt.tcp.TCP):
                     # TODO
@@ -95,4 +120,49 @@ class DissectionEngineDpkt(DissectionEngine):
                     self.incr(dissection, prefix + "TCP.chksum", tcp.sum)
                     self.incr(dissection, prefix + "TCP.options", tcp.opts)
 
-                    # TODO: handle DNS and others for level 3
+                    if level >= PCAPDissectorLevel.DETAILED.value:
+                        self.dissect_dns(tcp, prefix + "TCP.")
+
+                elif isinstance(ip.data, dpkt.icmp.ICMP):
+                    icmp = ip.data
+                    self.incr(dissection, prefix + "ICMP.type", icmp.type)
+                    self.incr(dissection, prefix + "ICMP.code", icmp.code)
+                    self.incr(dissection, prefix + "ICMP.chksum", icmp.sum)
+
+    def dissect_dns(self, transport, prefix: str) -> None:
+        "Dissects a DNS payload (if one exists) riding on top of UDP or TCP"
+        if transport.sport != 53 and transport.dport != 53:
+            return
+
+        payload = transport.data
+        if isinstance(transport, dpkt.tcp.TCP):
+            # DNS over TCP prefixes the message with a two-byte length
+            if len(payload) < 2:
+                return
+            payload = payload[2:]
+
+        try:
+            dns = dpkt.dns.DNS(payload)
+        except (dpkt.dpkt.UnpackError, UnicodeDecodeError):
+            return
+
+        dissection = self.dissection
+        prefix = prefix + "DNS."
+
+        # these names are designed to match scapy names
+        self.incr(dissection, prefix + "id", dns.id)
+        self.incr(dissection, prefix + "opcode", dns.opcode)
+        self.incr(dissection, prefix + "rcode", dns.rcode)
+        self.incr(dissection, prefix + "qr", dns.qr)
+        self.incr(dissection, prefix + "qdcount", len(dns.qd))
+        self.incr(dissection, prefix + "ancount", len(dns.an))
+
+        for question in dns.qd:
+            self.incr(dissection, prefix + "qd.qname", question.name)
+            self.incr(dissection, prefix + "qd.qtype", question.type)
+            self.incr(dissection, prefix + "qd.qclass", question.cls)
+
+        for answer in dns.an:
+            self.incr(dissection, prefix + "an.rrname", answer.name)
+            self.incr(dissection, prefix + "an.type", answer.type)
+            self.incr(dissection, prefix + "an.ttl", answer.ttl)
@@ -1,21 +1,78 @@
+import sys
+
 from traffic_taffy.dissector_engine import DissectionEngine
-from traffic_taffy.dissection import Dissection
-from pcap_parallel import PCAPParallel as pcapp
+from traffic_taffy.dissection import Dissection, PCAPDissectorLevel
 from logging import warning
 
 from scapy.all import sniff
 
+# field name lists are identical for every instance of a layer class,
+# so compute them once per class rather than once per packet
+_NAME_CACHE: dict = {}
+
+# interned "prefix.field" strings by (prefix, field_name) -- building
+# them fresh per packet means millions of short-lived strings, and
+# interning lets the storage dicts reuse each key's cached hash
+_PREFIX_CACHE: dict = {}
+
 
 class DissectionEngineScapy(DissectionEngine):
-    def _init_(self, *args, **kwargs):
-        super()._init_(*args, **kwargs)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # layer prefix strings ("Ethernet.IP.TCP.", ...) by layer-class
+        # chain, so each distinct packet shape is formatted only once
+        self._prefix_cache = {}
+
+    def apply_layer_filter(self) -> None:
+        """Restricts scapy to the layers this dissection level cares about.
+
+        Scapy evaluates every registered layer's bind_layers guards per
+        packet, so disabling the (many) layers we never count is a large
+        per-packet saving below the DETAILED level."""
+        level = self.dissector_level
+        if isinstance(level, PCAPDissectorLevel):
+            level = level.value
+
+        from scapy.config import conf
+
+        if level >= PCAPDissectorLevel.DETAILED.value:
+            # DETAILED wants everything scapy can name, so undo any
+            # reduced set a lower-level load left behind in this process
+            try:
+                if getattr(conf.layers, "filtered", False):
+                    conf.layers.unfilter()
+            except (AttributeError, ValueError):
+                pass
+            return
+
+        from scapy.layers.l2 import Ether
+
+        if level >= PCAPDissectorLevel.THROUGH_IP.value:
+            from scapy.layers.inet import IP, TCP, UDP, ICMP
+            from scapy.layers.inet6 import IPv6
+            from scapy.layers.dns import DNS
+
+            wanted = [Ether, IP, IPv6, TCP, UDP, ICMP, DNS]
+        else:
+            # COUNT_ONLY never looks past the frame itself
+            wanted = [Ether]
+
+        try:
+            # scapy refuses to filter twice, and reused processes (eg
+            # pool workers) call load() more than once
+            if getattr(conf.layers, "filtered", False):
+                conf.layers.unfilter()
+            conf.layers.filter(wanted)
+        except (AttributeError, ValueError):
+            warning("this scapy version cannot filter layers; continuing unfiltered")
 
     def load(self) -> Dissection:
         "Loads a pcap file into a nested dictionary of statistical counts"
         self.init_dissection()
+        self.apply_layer_filter()
         load_this = self.pcap_file
         if isinstance(self.pcap_file, str):
-            load_this = pcapp.open_maybe_compressed(self.pcap_file)
+            load_this = self.open_pcap_file()
         sniff(
             offline=load_this,
             prn=self.callback,
@@ -65,16 +122,26 @@ class DissectionEngineScapy(DissectionEngine):
 
             pdb.set_trace()
 
-        if hasattr(layer, "fields_desc"):
-            name_list = [field.name for field in layer.fields_desc]
-        elif hasattr(layer, "fields"):
-            name_list = [field.name for field in layer.fields]
-        else:
-            warning(f"unavailable to deep dive into: {layer}")
-            return
+        layer_class = type(layer)
+        name_list = _NAME_CACHE.get(layer_class)
+        if name_list is None:
+            if hasattr(layer, "fields_desc"):
+                name_list = tuple(field.name for field in layer.fields_desc)
+            elif hasattr(layer, "fields"):
+                name_list = tuple(field.name for field in layer.fields)
+            else:
+                warning(f"unavailable to deep dive into: {layer}")
+                return
+            _NAME_CACHE[layer_class] = name_list
 
         for field_name in name_list:
-            new_prefix = prefix + field_name
+            cache_key = (prefix, field_name)
+            cached = _PREFIX_CACHE.get(cache_key)
+            if cached is None:
+                new_prefix = sys.intern(prefix + field_name)
+                cached = (new_prefix, sys.intern(new_prefix + "."))
+                _PREFIX_CACHE[cache_key] = cached
+            new_prefix, dotted_prefix = cached
 
             if new_prefix in self.ignore_list:
                 continue
@@ -82,7 +149,7 @@ class DissectionEngineScapy(DissectionEngine):
             try:
                 field_value = getattr(layer, field_name)
                 if hasattr(field_value, "fields"):
-                    self.add_layer(field_value, new_prefix + ".")
+                    self.add_layer(field_value, dotted_prefix)
                 else:
                     self.add_item(field_value, new_prefix)
             except Exception as e:
@@ -90,12 +157,23 @@ class DissectionEngineScapy(DissectionEngine):
                 warning(e)
 
     def callback(self, packet):
-        prefix = "."
         self.timestamp = int(packet.time)
         if self.bin_size:
             self.timestamp = self.timestamp - self.timestamp % self.bin_size
 
         self.dissection.incr(Dissection.TOTAL_COUNT, Dissection.TOTAL_SUBKEY)
-        for payload in packet.iterpayloads():
-            prefix = f"{prefix}{payload.name}."
-            self.add_layer(payload, prefix[1:])
+
+        payloads = list(packet.iterpayloads())
+        chain = tuple(type(payload) for payload in payloads)
+        prefixes = self._prefix_cache.get(chain)
+        if prefixes is None:
+            # interning makes the (reused) prefixes hash-cached dict keys
+            prefix = "."
+            prefixes = []
+            for payload in payloads:
+                prefix = f"{prefix}{payload.name}."
+                prefixes.append(sys.intern(prefix[1:]))
+            self._prefix_cache[chain] = prefixes
+
+        for payload, prefix in zip(payloads, prefixes):
+            self.add_layer(payload, prefix)
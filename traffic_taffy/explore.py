@@ -172,6 +172,9 @@ class TaffyExplorer(QDialog, PcapGraphData):
             dissection_level=self.args.dissection_level,
             between_times=self.args.between_times,
             bin_size=self.args.bin_size,
+            use_scapy=self.args.use_scapy,
+            pcap_read_buffer=self.args.pcap_read_buffer,
+            maximum_cores=self.args.jobs,
         )
 
         # create the graph data storage
@@ -9,6 +9,7 @@ from traffic_taffy.dissector import (
     check_dissector_level,
 )
 from traffic_taffy.dissectmany import PCAPDissectMany
+from traffic_taffy.dissector_engine import PCAP_READ_BUFFER
 from traffic_taffy.graphdata import PcapGraphData
 
 from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
@@ -71,6 +72,9 @@ class PcapGraph(PcapGraphData):
         cache_pcap_results: bool = False,
         dissector_level: PCAPDissectorLevel = PCAPDissectorLevel.COUNT_ONLY,
         interactive: bool = False,
+        use_scapy: bool = False,
+        pcap_read_buffer: int = PCAP_READ_BUFFER,
+        maximum_cores: int | None = None,
     ):
         self.pcap_files = pcap_files
         self.output_file = output_file
@@ -84,13 +88,14 @@ class PcapGraph(PcapGraphData):
         self.cache_pcap_results = cache_pcap_results
         self.dissector_level = dissector_level
         self.interactive = interactive
+        self.use_scapy = use_scapy
+        self.pcap_read_buffer = pcap_read_buffer
+        self.maximum_cores = maximum_cores
 
         super().__init__()
 
     def load_pcaps(self):
         "loads the pcap and counts things into bins"
-        self.data = {}
-
         info("reading pcap files")
         pdm = PCAPDissectMany(
             self.pcap_files,
@@ -99,11 +104,11 @@ class PcapGraph(PcapGraphData):
             dissector_level=self.dissector_level,
             pcap_filter=self.pkt_filter,
             cache_results=self.cache_pcap_results,
+            use_scapy=self.use_scapy,
+            pcap_read_buffer=self.pcap_read_buffer,
+            maximum_cores=self.maximum_cores,
         )
-        results = pdm.load_all()
-
-        for result in results:
-            self.data[result["file"]] = result["data"]
+        self.dissections = list(pdm.load_all())
         info("done reading pcap files")
 
     def create_graph(self):
@@ -171,6 +176,9 @@ def main():
         cache_pcap_results=args.cache_pcap_results,
         dissector_level=args.dissection_level,
         interactive=args.interactive,
+        use_scapy=args.use_scapy,
+        pcap_read_buffer=args.pcap_read_buffer,
+        maximum_cores=args.jobs,
     )
     pc.graph_it()
 
@@ -1,5 +1,6 @@
 import os
-from pandas import DataFrame, to_datetime, concat
+import numpy as np
+from pandas import Categorical, DataFrame, to_datetime
 
 
 class PcapGraphData:
@@ -16,14 +17,15 @@ class PcapGraphData:
         self._dissections = newvalue
 
     def normalize_bins(self, dissection):
-        results = {}
         time_keys = list(dissection.data.keys())
         if time_keys[0] == 0:  # likely always
             time_keys.pop(0)
 
-        results = {"time": [], "count": [], "index": [], "key": []}
+        times = []
+        counts = []
+        indexes = []
 
-        # TODO: this could likely be made much more efficient and needs hole-filling
+        # TODO: this needs hole-filling
         for timestamp, key, subkey, value in dissection.find_data(
             timestamps=time_keys,
             match_string=self.match_string,
@@ -31,22 +33,40 @@ class PcapGraphData:
             minimum_count=self.minimum_count,
             make_printable=True,
         ):
-            index = key + "=" + subkey
-            results["count"].append(int(value))
-            results["index"].append(index)
-            results["key"].append(index)
-            results["time"].append(timestamp)
+            times.append(timestamp)
+            counts.append(int(value))
+            indexes.append(key + "=" + subkey)
 
-        return results
+        # typed numpy columns are far cheaper for pandas to consume
+        # than per-record python lists ('key' and 'index' are always
+        # identical, so they share one array)
+        indexes = np.asarray(indexes, dtype=object)
+        return {
+            "time": np.asarray(times, dtype=np.int64),
+            "count": np.asarray(counts, dtype=np.int64),
+            "index": indexes,
+            "key": indexes,
+        }
 
     def get_dataframe(self):
-        datasets = []
+        # gather every dissection's columns and concatenate each column
+        # exactly once -- per-dissection DataFrames plus concat() would
+        # copy all the buffers again, and converting timestamps on the
+        # final frame builds only a single DatetimeIndex
+        columns = {"time": [], "count": [], "index": [], "key": []}
+        filenames = []
         for dissection in self.dissections:
             data = self.normalize_bins(dissection)
-            data = DataFrame.from_records(data)
-            data["filename"] = os.path.basename(dissection.pcap_file)
-            data["time"] = to_datetime(data["time"], unit="s", utc=True)
-            data["key"] = data["index"]
-            datasets.append(data)
-        datasets = concat(datasets, ignore_index=True)
-        return datasets
+            for name, chunks in columns.items():
+                chunks.append(data[name])
+            filenames.append(
+                np.repeat(os.path.basename(dissection.pcap_file), len(data["time"]))
+            )
+
+        dataset = DataFrame(
+            {name: np.concatenate(chunks) for name, chunks in columns.items()}
+        )
+        dataset["time"] = to_datetime(dataset["time"], unit="s", utc=True)
+        # categorical filenames store each (heavily repeated) name once
+        dataset["filename"] = Categorical(np.concatenate(filenames))
+        return dataset
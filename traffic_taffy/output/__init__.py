@@ -1,3 +1,8 @@
+import re
+
+import numpy as np
+
+
 class Output:
     def __init__(self, report, options={}):
         self.report = report
@@ -19,6 +24,19 @@ class Output:
     def output_options(self, new_output_options):
         self._output_options = new_output_options
 
+    def build_key_matcher(self):
+        """Compiles the match_string option into a single regex.
+
+        Comma-separated match strings become one alternation pattern,
+        so every key is scanned once no matter how many patterns were
+        given."""
+        match_string = self.output_options.get("match_string")
+        if match_string is None:
+            return None
+        return re.compile(
+            "|".join(map(re.escape, filter(None, match_string.split(","))))
+        )
+
     def output(self, report=None):
         if not report:
             report = self.report
@@ -26,6 +44,8 @@ class Output:
 
         first_of_anything: bool = True
 
+        key_matcher = self.build_key_matcher()
+
         top_records = self.output_options.get("top_records")
 
         # intentionally reversed, as it should default to high to low
@@ -34,23 +54,38 @@ class Output:
         for key in sorted(contents):
             reported: bool = False
 
-            if (
-                self.output_options.get("match_string") is not None
-                and self.output_options["match_string"] not in key
-            ):
+            if key_matcher and not key_matcher.search(key):
                 continue
 
             # TODO: we don't do match_value here?
 
+            # the contents are parallel numpy columns with a row per
+            # subkey -- sort them once and build a (small) dict only for
+            # the rows that actually get output
+            columns = contents[key]
+            subkeys = columns["subkeys"]
+            order = np.argsort(columns["delta_percentage"], kind="stable")
+            if sort_order:
+                order = order[::-1]
+
+            # resolve the configured thresholds once into a mask over
+            # all rows rather than re-branching per record
+            mask = self.filter_mask(columns)
+
             record_count = 0
-            for subkey, data in sorted(
-                contents[key].items(),
-                key=lambda x: x[1]["delta_percentage"],
-                reverse=sort_order,
-            ):
-                if not self.filter_check(data):
+            for row in order:
+                if not mask[row]:
                     continue
 
+                data = {
+                    "delta_percentage": float(columns["delta_percentage"][row]),
+                    "delta_absolute": int(columns["delta_absolute"][row]),
+                    "total": int(columns["total"][row]),
+                    "left_count": int(columns["left_count"][row]),
+                    "right_count": int(columns["right_count"][row]),
+                }
+                subkey = subkeys[row]
+
                 # print the header
                 if not reported:
                     if first_of_anything:
@@ -75,44 +110,24 @@ class Output:
     def output_close(self):
         return
 
-    def filter_check(self, data: dict) -> bool:
-        "Return true if we should include it."
-        delta: float = data["delta_percentage"]
-        total: int = data["total"]
-
-        if self.output_options["only_positive"] and delta <= 0:
-            return False
-
-        if self.output_options["only_negative"] and delta >= 0:
-            return False
-
-        if (
-            not self.output_options["print_threshold"]
-            and not self.output_options["minimum_count"]
-        ):
-            # always print
-            return True
-
-        if (
-            self.output_options["print_threshold"]
-            and not self.output_options["minimum_count"]
-        ):
-            # check output_options["print_threshold"] as a fraction
-            if abs(delta) > self.output_options["print_threshold"]:
-                return True
-        elif (
-            not self.output_options["print_threshold"]
-            and self.output_options["minimum_count"]
-        ):
-            # just check output_options["minimum_count"]
-            if total > self.output_options["minimum_count"]:
-                return True
-        else:
-            # require both
-            if (
-                total > self.output_options["minimum_count"]
-                and abs(delta) > self.output_options["print_threshold"]
-            ):
-                return True
-
-        return False
+    def filter_mask(self, columns: dict):
+        "Returns a boolean row mask of the records we should include."
+        delta = columns["delta_percentage"]
+        total = columns["total"]
+
+        mask = np.ones(len(delta), dtype=bool)
+
+        if self.output_options["only_positive"]:
+            mask &= delta > 0
+
+        if self.output_options["only_negative"]:
+            mask &= delta < 0
+
+        # print_threshold is a fraction
+        if self.output_options["print_threshold"]:
+            mask &= np.abs(delta) > self.output_options["print_threshold"]
+
+        if self.output_options["minimum_count"]:
+            mask &= total > self.output_options["minimum_count"]
+
+        return mask
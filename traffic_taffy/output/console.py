@@ -8,6 +8,9 @@ class Console(Output):
         super().__init__(*args, **kwargs)
         self.console = None
         self.have_done_header = False
+        # styled lines awaiting output; every console.print pays for a
+        # full rich layout pass, so emit whole sections at once
+        self.pending_lines = []
 
     # actual routines to print stuff
     def init_console(self):
@@ -39,9 +42,18 @@ class Console(Output):
 
         self.console.print(line)
 
+    def flush_pending_lines(self):
+        if self.pending_lines:
+            self.console.print("\n".join(self.pending_lines))
+            self.pending_lines = []
+
     def output_new_section(self, key):
+        self.flush_pending_lines()
         print(f"----- {key}")
 
+    def output_close(self):
+        self.flush_pending_lines()
+
     def output_record(self, key, subkey, data) -> None:
         "prints a report to the console"
 
@@ -65,5 +77,5 @@ class Console(Output):
         line += f" {data['left_count']:>8} {data['right_count']:>8} {data['delta_absolute']:>8}"
         line += f" {100*delta_percentage:>7.2f}"
 
-        # print it to the rich console
-        self.console.print(line)
+        # queue it for printing when the section completes
+        self.pending_lines.append(line)
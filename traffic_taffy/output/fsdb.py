@@ -31,7 +31,7 @@ class Fsdb(Output):
     def output_record(self, key, subkey, data) -> None:
         "prints a report to the console"
 
-        delta: float = data["delta"]
+        delta: float = data["delta_percentage"]
 
         subkey = Dissection.make_printable(key, subkey)
         self.fsdb.append(
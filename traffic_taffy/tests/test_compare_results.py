@@ -1,4 +1,5 @@
 from collections import Counter
+import numpy as np
 from traffic_taffy.compare import PcapCompare
 
 
@@ -8,29 +9,39 @@ def test_compare_results():
 
     # this should be positive when right_data is larger
     expected = {
-        "src": {
-            "a": {
-                "delta": 15.0 / 30.0 - 5.0 / 15.0,
-                "total": 20,
-                "left_count": 5,
-                "right_count": 15,
-            },
-            "b": {
-                "delta": -1.0,
-                "total": 10,  # only in 1
-                "left_count": 10,
-                "right_count": 0,
-            },
-            "c": {
-                "delta": 1.0,
-                "total": 15,  # only in 2
-                "left_count": 0,
-                "right_count": 15,
-            },
-        }
+        "a": {
+            "delta_percentage": 15.0 / 30.0 - 5.0 / 15.0,
+            "delta_absolute": 10,
+            "total": 20,
+            "left_count": 5,
+            "right_count": 15,
+        },
+        "b": {
+            "delta_percentage": -1.0,
+            "delta_absolute": -10,
+            "total": -10,  # only in 1
+            "left_count": 10,
+            "right_count": 0,
+        },
+        "c": {
+            "delta_percentage": 1.0,
+            "delta_absolute": 15,
+            "total": 15,  # only in 2
+            "left_count": 0,
+            "right_count": 15,
+        },
     }
 
     pc = PcapCompare([1, 2])  # bogus files
     report = pc.compare_dissections(left_data[0], right_data[0])
 
-    assert report == expected
+    # the contents are parallel numpy columns with one row per subkey
+    columns = report.contents["src"]
+    assert set(columns["subkeys"]) == set(expected.keys())
+
+    for row, subkey in enumerate(columns["subkeys"]):
+        for column_name in ["delta_absolute", "total", "left_count", "right_count"]:
+            assert columns[column_name][row] == expected[subkey][column_name]
+        assert np.isclose(
+            columns["delta_percentage"][row], expected[subkey]["delta_percentage"]
+        )
@@ -1,10 +1,10 @@
-from traffic_taffy.graph import PcapGraphData
-from collections import Counter, defaultdict
+from traffic_taffy.dissection import Dissection
+from traffic_taffy.graphdata import PcapGraphData
 
 
 class ParentFaker(PcapGraphData):
     def __init__(self):
-        self.match_key = None
+        self.match_string = None
         self.match_value = None
         self.minimum_count = 0
         self.bin_size = 1
@@ -14,22 +14,19 @@ class ParentFaker(PcapGraphData):
 
 def test_pcap_normalize():
     pg = ParentFaker()
-    data = {}
+    dissection = Dissection("bogus")
 
-    # build a dictionary with [n][a][b] = 1 for every 2 spots
+    # build a dissection with [n][a][b] = 1 for every 2 spots
     # eg (n=0,2,4...)
     for i in range(0, 10, 2):
-        data[i] = defaultdict(Counter)
-        data[i]["a"]["b"] += 1
+        dissection.data[i]["a"]["b"] += 1
 
     # add entries for [n][c][d] = 1 for every 3 spots
     # eg (n=0,3,6,...)
     for i in range(0, 10, 3):
-        if i not in data:
-            data[i] = defaultdict(Counter)
-        data[i]["c"]["d"] += 2
+        dissection.data[i]["c"]["d"] += 2
 
-    results = pg.normalize_bins(data)
+    results = pg.normalize_bins(dissection)
 
     # note: we only normalize non 0 indexes (ie, "real" timestamps)
 
@@ -37,59 +34,43 @@ def test_pcap_normalize():
     # comparisons easier
 
     ret_index = ["a=b", "a=b", "a=b", "c=d", "a=b", "c=d", "c=d"]
-    assert results == {
-        "time": [2, 4, 6, 6, 8, 3, 9],
-        "index": ret_index,
-        "key": ret_index,
-        "count": [1, 1, 1, 2, 1, 2, 2],
-    }
+    assert list(results["time"]) == [2, 4, 6, 6, 8, 3, 9]
+    assert list(results["count"]) == [1, 1, 1, 2, 1, 2, 2]
+    assert list(results["index"]) == ret_index
+    assert list(results["key"]) == ret_index
 
 
 def test_pcap_normalize_with_gaps():
     pg = ParentFaker()
-    data = defaultdict(Counter)
+    dissection = Dissection("bogus")
+
     for i in range(14, 100, 7):
-        data[i] = defaultdict(Counter)
+        dissection.data[i]  # create (possibly empty) bins in time order
         if i % 14 == 0:
-            data[i]["a"]["b"] += 1
+            dissection.data[i]["a"]["b"] += 1
     for i in range(14, 100, 7):
         if i % 21 == 0:
-            if i not in data:
-                data[i] = defaultdict(Counter)
-            data[i]["c"]["d"] += 1
+            dissection.data[i]["c"]["d"] += 1
 
-    results = pg.normalize_bins(data)
+    results = pg.normalize_bins(dissection)
     # TODO: sort these and ensure they're right (again)
-    assert results == {
-        "time": [14, 21, 28, 42, 42, 56, 63, 70, 84, 84, 98],
-        "count": [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        "index": [
-            "a=b",
-            "c=d",
-            "a=b",
-            "a=b",
-            "c=d",
-            "a=b",
-            "c=d",
-            "a=b",
-            "a=b",
-            "c=d",
-            "a=b",
-        ],
-        "key": [
-            "a=b",
-            "c=d",
-            "a=b",
-            "a=b",
-            "c=d",
-            "a=b",
-            "c=d",
-            "a=b",
-            "a=b",
-            "c=d",
-            "a=b",
-        ],
-    }
+    ret_index = [
+        "a=b",
+        "c=d",
+        "a=b",
+        "a=b",
+        "c=d",
+        "a=b",
+        "c=d",
+        "a=b",
+        "a=b",
+        "c=d",
+        "a=b",
+    ]
+    assert list(results["time"]) == [14, 21, 28, 42, 42, 56, 63, 70, 84, 84, 98]
+    assert list(results["count"]) == [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+    assert list(results["index"]) == ret_index
+    assert list(results["key"]) == ret_index
 
 
 def main():